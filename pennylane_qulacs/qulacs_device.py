@@ -1,6 +1,7 @@
 import numpy as np
 import functools
 import itertools
+import math
 from scipy.linalg import block_diag
 from collections import OrderedDict
 
@@ -19,6 +20,8 @@ try:
 except ImportError:
     GPU_SUPPORTED = False
 
+DIAGONAL_SUPPORTED = hasattr(gate, 'DiagonalMatrix')
+
 
 I = np.identity(2)
 X = np.array([[0, 1], [1, 0]])
@@ -26,21 +29,33 @@ Y = np.array([[0, -1j], [1j, 0]])
 Z = np.array([[1, 0], [0, -1]])
 H = np.array([[1, 1], [1, -1]])/np.sqrt(2)
 SWAP = np.array([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]])
-CSWAP = block_diag(I, I, SWAP)
+CSWAP = np.ascontiguousarray(block_diag(I, I, SWAP), dtype=np.complex128)
 
 rx = lambda theta: np.cos(theta / 2) * I + 1j * np.sin(-theta / 2) * X
 ry = lambda theta: np.cos(theta / 2) * I + 1j * np.sin(-theta / 2) * Y
 rz = lambda theta: np.cos(theta / 2) * I + 1j * np.sin(-theta / 2) * Z
-crz = lambda theta: np.array(
-    [
-        [1, 0, 0, 0],
-        [0, 1, 0, 0],
-        [0, 0, np.exp(-1j * theta / 2), 0],
-        [0, 0, 0, np.exp(1j * theta / 2)],
-    ]
-)
+
+_CRZ = np.identity(4, dtype=np.complex128)
+
+
+def crz(theta):
+    M = _CRZ.copy()
+    c = math.cos(theta / 2)
+    s = math.sin(theta / 2)
+    M[2, 2] = c - 1j * s
+    M[3, 3] = c + 1j * s
+    return M
+
+
+def crz_diag(theta):
+    c = math.cos(theta / 2)
+    s = math.sin(theta / 2)
+    return np.array([1, 1, c - 1j * s, c + 1j * s], dtype=np.complex128)
+
+
 toffoli = np.diag([1 for i in range(8)])
 toffoli[6:8, 6:8] = np.array([[0, 1], [1, 0]])
+toffoli = np.ascontiguousarray(toffoli, dtype=np.complex128)
 
 
 def hermitian(*args):
@@ -55,7 +70,9 @@ def hermitian(*args):
     if A.shape[0] != A.shape[1]:
         raise ValueError('Expectation must be a square matrix.')
 
-    if not np.allclose(A, A.conj().T):
+    rows, cols = np.triu_indices(A.shape[0], 1)
+    if not (np.allclose(A.diagonal().imag, 0)
+            and np.allclose(A[rows, cols], np.conj(A[cols, rows]))):
         raise ValueError('Expectation must be Hermitian.')
 
     return A
@@ -74,14 +91,8 @@ class QulacsDevice(Device):
         'tensor_observables': True
     }
 
-    _operations_map = {
-        'QubitStateVector': None,
-        'BasisState': None,
-        'QubitUnitary': None,
-        'Toffoli': toffoli,
-        'CSWAP': CSWAP,
-        'CRZ': crz,
-        'Rot': None,
+    # native qulacs gate factories, called as factory(*wires, *par)
+    _gate_map = {
         'SWAP': gate.SWAP,
         'CNOT': gate.CNOT,
         'CZ': gate.CZ,
@@ -97,6 +108,35 @@ class QulacsDevice(Device):
         'PauliZ': gate.Z,
         'Hadamard': gate.H
     }
+    # precomputed matrices for gates without a native factory
+    _matrix_constants = {
+        'Toffoli': toffoli,
+        'CSWAP': CSWAP
+    }
+    # builders producing a gate matrix from the parameters
+    _matrix_builders = {
+        'CRZ': crz
+    }
+    # diagonals for the builders above that are diagonal gates; used
+    # instead of the dense matrix when qulacs exposes DiagonalMatrix
+    _diagonal_builders = {
+        'CRZ': crz_diag
+    }
+    # inverse partner of each parameter-free gate; adjacent pairs on the
+    # same wires cancel before they ever reach the simulator
+    _inverse_map = {
+        'S': 'Sdg',
+        'Sdg': 'S',
+        'T': 'Tdg',
+        'Tdg': 'T',
+        'PauliX': 'PauliX',
+        'PauliY': 'PauliY',
+        'PauliZ': 'PauliZ',
+        'Hadamard': 'Hadamard',
+        'CNOT': 'CNOT',
+        'CZ': 'CZ',
+        'SWAP': 'SWAP'
+    }
     _observable_map = {
         'PauliX': X,
         'PauliY': Y,
@@ -106,12 +146,18 @@ class QulacsDevice(Device):
         'Hermitian': hermitian
     }
 
-    operations = _operations_map.keys()
+    operations = (set(_gate_map) | set(_matrix_constants) | set(_matrix_builders)
+                  | {'QubitStateVector', 'BasisState', 'QubitUnitary', 'Rot'})
     observables = _observable_map.keys()
 
-    def __init__(self, wires, gpu=False, **kwargs):
+    def __init__(self, wires, gpu=False, fusion_level=None, record_circuit=False, **kwargs):
         super().__init__(wires=wires)
 
+        if fusion_level is None:
+            # on the GPU the per-gate kernel launch dominates for small
+            # gates, so fused blocks are worth it by default
+            fusion_level = 4 if gpu else 0
+
         if gpu:
             if not GPU_SUPPORTED:
                 raise DeviceError(
@@ -123,9 +169,35 @@ class QulacsDevice(Device):
         else:
             self._state = QuantumState(wires)
 
-        self._circuit = QuantumCircuit(wires)
+        self._record_circuit = record_circuit
+        self._circuit = QuantumCircuit(wires) if record_circuit else None
         self._first_operation = True
 
+        self._fusion_level = fusion_level
+        self._fused_wires = None
+        self._fused_matrix = None
+
+        # last cancellable gate, held back one step so an adjacent
+        # inverse can annihilate it
+        self._held = None
+
+        # constructed gates for parameter-free operations, keyed by
+        # (name, wires); repeated applications on the same wires reuse
+        # the same C++ gate object instead of copying the matrix again
+        self._gate_cache = {}
+
+        # dispatch table resolving each operation to its applier in a
+        # single dict lookup instead of a chain of name comparisons
+        self._apply_map = {
+            'QubitStateVector': self._apply_qubit_state_vector,
+            'BasisState': self._apply_basis_state,
+            'QubitUnitary': self._apply_qubit_unitary,
+            'Rot': self._apply_rot,
+            'CRZ': self._apply_matrix_builder,
+            'Toffoli': self._apply_matrix_constant,
+            'CSWAP': self._apply_matrix_constant,
+        }
+
     def apply(self, operation, wires, par):
         if operation == 'BasisState' and not self._first_operation:
             raise DeviceError(
@@ -135,51 +207,179 @@ class QulacsDevice(Device):
 
         self._first_operation = False
 
-        if operation == 'QubitStateVector':
-            if len(par[0]) != 2**len(wires):
-                raise ValueError('State vector must be of length 2**wires.')
-
-            self._state.load(par[0])
-        elif operation == 'BasisState':
-            if len(par[0]) != len(wires):
-                raise ValueError('Basis state must prepare all qubits.')
-
-            basis_state = 0
-            for bit in reversed(par[0]):
-                basis_state = (basis_state << 1) | bit
-
-            self._state.set_computational_basis(basis_state)
-        elif operation == 'QubitUnitary':
-            if len(par[0]) != 2 ** len(wires):
-                raise ValueError('Unitary matrix must be of shape (2**wires, 2**wires).')
-
-            unitary_gate = gate.DenseMatrix(wires, par[0])
-            self._circuit.add_gate(unitary_gate)
-        elif operation == 'Rot':
-            self._circuit.add_gate(gate.merge([
-                gate.RZ(wires[0], par[0]),
-                gate.RY(wires[0], par[1]),
-                gate.RZ(wires[0], par[2])
-            ]))
-        elif operation in ('CRZ', 'Toffoli', 'CSWAP'):
-            mapped_operation = self._operations_map[operation]
-            if callable(mapped_operation):
-                gate_matrix = mapped_operation(*par)
+        applier = self._apply_map.get(operation, self._apply_native_gate)
+        applier(operation, wires, par)
+
+    def _apply_qubit_state_vector(self, operation, wires, par):
+        if len(par[0]) != 2**len(wires):
+            raise ValueError('State vector must be of length 2**wires.')
+
+        self._release_held()
+        self._flush_fused()
+        self._state.load(par[0])
+
+    def _apply_basis_state(self, operation, wires, par):
+        if len(par[0]) != len(wires):
+            raise ValueError('Basis state must prepare all qubits.')
+
+        self._release_held()
+        self._flush_fused()
+
+        bits = np.asarray(par[0], dtype=np.int64)
+        basis_state = int(bits.dot(1 << np.arange(bits.size)))
+
+        self._state.set_computational_basis(basis_state)
+
+    def _apply_qubit_unitary(self, operation, wires, par):
+        if len(par[0]) != 2 ** len(wires):
+            raise ValueError('Unitary matrix must be of shape (2**wires, 2**wires).')
+
+        self._apply_gate(gate.DenseMatrix(wires, par[0]))
+
+    def _apply_rot(self, operation, wires, par):
+        self._apply_gate(gate.merge([
+            gate.RZ(wires[0], par[0]),
+            gate.RY(wires[0], par[1]),
+            gate.RZ(wires[0], par[2])
+        ]))
+
+    def _apply_matrix_constant(self, operation, wires, par):
+        key = (operation, tuple(wires))
+        dense_gate = self._gate_cache.get(key)
+        if dense_gate is None:
+            dense_gate = gate.DenseMatrix(wires, self._matrix_constants[operation])
+            self._gate_cache[key] = dense_gate
+
+        self._apply_gate(dense_gate)
+
+    def _apply_matrix_builder(self, operation, wires, par):
+        if DIAGONAL_SUPPORTED and operation in self._diagonal_builders:
+            diagonal = self._diagonal_builders[operation](*par)
+            self._apply_gate(gate.DiagonalMatrix(wires, diagonal))
+            return
+
+        self._apply_gate(gate.DenseMatrix(wires, self._matrix_builders[operation](*par)))
+
+    def _apply_native_gate(self, operation, wires, par):
+        if not par:
+            key = (operation, tuple(wires))
+            native_gate = self._gate_cache.get(key)
+            if native_gate is None:
+                native_gate = self._gate_map[operation](*wires)
+                self._gate_cache[key] = native_gate
+
+            if operation in self._inverse_map:
+                self._queue_cancellable(operation, key[1], native_gate)
             else:
-                gate_matrix = mapped_operation
+                self._apply_gate(native_gate)
+            return
+
+        self._apply_gate(self._gate_map[operation](*wires, *par))
+
+    def _queue_cancellable(self, operation, wires, gate_instance):
+        """Hold a cancellable gate one step; adjacent inverse pairs drop out."""
+        if self._held is not None:
+            held_operation, held_wires, held_gate = self._held
+            if held_wires == wires and self._inverse_map[held_operation] == operation:
+                self._held = None
+                return
+
+            self._held = None
+            self._apply_gate(held_gate)
+
+        self._held = (operation, wires, gate_instance)
+
+    def _release_held(self):
+        """Apply the held gate once it can no longer be cancelled."""
+        if self._held is not None:
+            held_gate = self._held[2]
+            self._held = None
+            self._apply_gate(held_gate)
+
+    def _apply_gate(self, gate_instance):
+        """Advance the state with a single gate instance and record it."""
+        self._release_held()
+        if self._fusion_level > 0 and self._fuse(gate_instance):
+            return
+
+        self._flush_fused()
+        gate_instance.update_quantum_state(self._state)
+        if self._record_circuit:
+            self._circuit.add_gate(gate_instance)
+
+    def _fuse(self, gate_instance):
+        """Try to merge a gate into the pending fused block.
+
+        Consecutive gates on overlapping small supports are multiplied into
+        a single matrix, so the state vector is swept once per fused block
+        instead of once per gate. Returns ``False`` for gates that cannot be
+        fused (controlled gates, or supports wider than the fusion level).
+        """
+        if gate_instance.get_control_index_list():
+            return False
+
+        wires = gate_instance.get_target_index_list()
+        if len(wires) > self._fusion_level:
+            return False
+
+        matrix = np.asarray(gate_instance.get_matrix(), dtype=complex)
+
+        if self._fused_wires is not None:
+            merged_wires = self._fused_wires + [w for w in wires if w not in self._fused_wires]
+            if len(merged_wires) <= self._fusion_level:
+                self._fused_matrix = np.matmul(
+                    self._expand_matrix(matrix, wires, merged_wires),
+                    self._expand_matrix(self._fused_matrix, self._fused_wires, merged_wires)
+                )
+                self._fused_wires = merged_wires
+                return True
 
-            dense_gate = gate.DenseMatrix(wires, gate_matrix)
-            self._circuit.add_gate(dense_gate)
-        else:
-            mapped_operation = self._operations_map[operation]
-            self._circuit.add_gate(mapped_operation(*wires, *par))
+            self._flush_fused()
+
+        self._fused_wires = list(wires)
+        self._fused_matrix = matrix
+        return True
+
+    def _flush_fused(self):
+        """Emit the pending fused block as a single dense gate."""
+        if self._fused_wires is None:
+            return
+
+        fused_gate = gate.DenseMatrix(self._fused_wires, self._fused_matrix)
+        self._fused_wires = None
+        self._fused_matrix = None
+
+        fused_gate.update_quantum_state(self._state)
+        if self._record_circuit:
+            self._circuit.add_gate(fused_gate)
+
+    @staticmethod
+    def _expand_matrix(matrix, wires, target_wires):
+        """Embed a gate matrix acting on ``wires`` into the space of ``target_wires``."""
+        if list(wires) == list(target_wires):
+            return matrix
+
+        free_wires = [w for w in target_wires if w not in wires]
+        expanded = np.kron(np.identity(2 ** len(free_wires)), matrix)
+
+        # reorder from (wires + free_wires) to target_wires; qulacs treats
+        # the first wire in the list as the least significant index bit
+        order = list(wires) + free_wires
+        idx = np.arange(2 ** len(target_wires))
+        perm = sum(
+            ((idx >> list(target_wires).index(w)) & 1) << b
+            for b, w in enumerate(order)
+        )
+
+        return expanded[np.ix_(perm, perm)]
 
     @property
     def state(self):
         return self._state.get_vector()
 
     def pre_measure(self):
-        self._circuit.update_quantum_state(self._state)
+        self._release_held()
+        self._flush_fused()
 
     def expval(self, observable, wires, par):
         bra = self._state.copy()
@@ -199,13 +399,21 @@ class QulacsDevice(Device):
 
     def probabilities(self):
         states = itertools.product(range(2), repeat=self.num_wires)
-        probs = np.abs(self.state)**2
+        vector = self.state
+        probs = vector.real**2 + vector.imag**2
 
         return OrderedDict(zip(states, probs))
 
     def reset(self):
         self._state.set_zero_state()
-        self._circuit = QuantumCircuit(self.num_wires)
+        if self._record_circuit:
+            # drop recorded gates in place instead of allocating a fresh
+            # QuantumCircuit on every reset
+            while self._circuit.get_gate_count() > 0:
+                self._circuit.remove_gate(self._circuit.get_gate_count() - 1)
+        self._held = None
+        self._fused_wires = None
+        self._fused_matrix = None
 
     def _get_operator_matrix(self, operation, par):
         A = self._observable_map[operation]
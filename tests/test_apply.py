@@ -18,6 +18,8 @@ import numpy as np
 import pennylane as qml
 from scipy.linalg import block_diag
 
+from pennylane_qulacs.qulacs_device import QulacsDevice
+
 from conftest import U, U2, A
 
 np.random.seed(42)
@@ -435,3 +437,104 @@ class TestHardwareApply:
         res = np.fromiter(dev.probabilities().values(), dtype=np.float64)
         expected = np.abs(func(theta) @ state) ** 2
         assert np.allclose(res, expected, **tol)
+
+
+@pytest.mark.parametrize("shots", [0])
+class TestGateFusion:
+    """Test that gate fusion does not change the simulated state."""
+
+    @pytest.mark.parametrize("fusion_level", [1, 2, 3])
+    def test_fusion_matches_plain_dispatch(self, init_state, fusion_level, tol):
+        """Test that a fused circuit produces the same state as gate-by-gate dispatch"""
+        dev = QulacsDevice(wires=3, fusion_level=fusion_level)
+        ref = QulacsDevice(wires=3)
+        state = init_state(3)
+
+        queue = [
+            ("QubitStateVector", [0, 1, 2], [state]),
+            ("Hadamard", [0], []),
+            ("RX", [1], [0.543]),
+            ("SWAP", [0, 2], []),
+            ("CNOT", [0, 1], []),
+            ("RY", [2], [-0.232]),
+            ("PauliZ", [0], []),
+            ("QubitUnitary", [0, 1], [U2]),
+        ]
+
+        for name, wires, par in queue:
+            dev.apply(name, wires, par)
+            ref.apply(name, wires, par)
+
+        dev._obs_queue = []
+        ref._obs_queue = []
+        dev.pre_measure()
+        ref.pre_measure()
+
+        assert np.allclose(dev.state, ref.state, **tol)
+
+    def test_fusion_flushed_before_state_load(self, init_state, tol):
+        """Test that pending fused gates do not leak past a state preparation"""
+        dev = QulacsDevice(wires=1, fusion_level=1)
+        state = init_state(1)
+
+        dev.apply("Hadamard", [0], [])
+        dev.apply("QubitStateVector", [0], [state])
+        dev._obs_queue = []
+        dev.pre_measure()
+
+        res = np.abs(dev.state) ** 2
+        expected = np.abs(state) ** 2
+        assert np.allclose(res, expected, **tol)
+
+
+@pytest.mark.parametrize("shots", [0])
+class TestPeepholeCancellation:
+    """Test that adjacent inverse gates cancel without changing results."""
+
+    @pytest.mark.parametrize(
+        "first,second",
+        [("Hadamard", "Hadamard"), ("S", "Sdg"), ("Tdg", "T"), ("PauliX", "PauliX")],
+    )
+    def test_adjacent_inverses_cancel(self, init_state, first, second, tol):
+        """Test that an inverse pair leaves the state untouched"""
+        dev = QulacsDevice(wires=1)
+        state = init_state(1)
+
+        dev.apply("QubitStateVector", [0], [state])
+        dev.apply(first, [0], [])
+        dev.apply(second, [0], [])
+        dev._obs_queue = []
+        dev.pre_measure()
+
+        res = np.abs(dev.state) ** 2
+        expected = np.abs(state) ** 2
+        assert np.allclose(res, expected, **tol)
+
+    def test_held_gate_still_applied(self, init_state, tol):
+        """Test that a lone cancellable gate is flushed at measurement"""
+        dev = QulacsDevice(wires=1)
+        state = init_state(1)
+
+        dev.apply("QubitStateVector", [0], [state])
+        dev.apply("PauliX", [0], [])
+        dev._obs_queue = []
+        dev.pre_measure()
+
+        res = np.abs(dev.state) ** 2
+        expected = np.abs(X @ state) ** 2
+        assert np.allclose(res, expected, **tol)
+
+    def test_no_cancellation_across_wires(self, init_state, tol):
+        """Test that gates on different wires do not cancel each other"""
+        dev = QulacsDevice(wires=2)
+        state = init_state(2)
+
+        dev.apply("QubitStateVector", [0, 1], [state])
+        dev.apply("PauliX", [0], [])
+        dev.apply("PauliX", [1], [])
+        dev._obs_queue = []
+        dev.pre_measure()
+
+        res = np.abs(dev.state) ** 2
+        expected = np.abs(np.kron(X, X) @ state) ** 2
+        assert np.allclose(res, expected, **tol)